@@ -3,70 +3,158 @@
 Goose Hybrid Mode - Run TUI and Web UI simultaneously
 """
 
+import importlib.util
+import multiprocessing
+import os
+import selectors
+import socket
 import subprocess
 import sys
 import time
-import threading
 import signal
 from pathlib import Path
 
+# Pre-import the heavy web stack in the forkserver so launching the web UI
+# is a cheap fork of an already-warmed process instead of a cold interpreter
+multiprocessing.set_start_method('forkserver', force=True)
+multiprocessing.set_forkserver_preload(
+    ['eventlet', 'flask', 'flask_socketio', 'flask_cors']
+)
+
 web_process = None
 tui_process = None
 
+def _reap_children(children, timeout=5.0):
+    """Terminate children and wait for all of them in parallel via pidfds
+
+    Sequential .wait()/.join() calls serialize shutdown; polling each
+    child's pidfd in one selectors loop halves the worst-case latency.
+    Children still alive at the deadline get SIGKILL so shutdown stays
+    bounded even if one ignores SIGTERM.
+    """
+    sel = selectors.DefaultSelector()
+
+    for proc in children:
+        proc.terminate()
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            continue  # already gone
+        sel.register(pidfd, selectors.EVENT_READ, proc)
+
+    def drain(deadline):
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            for key, _ in sel.select(timeout=remaining):
+                sel.unregister(key.fd)  # readable == child exited
+                os.close(key.fd)
+
+    drain(time.monotonic() + timeout)
+
+    # Escalate on whoever ignored SIGTERM; SIGKILL cannot be caught, so
+    # the short second drain is enough
+    if sel.get_map():
+        for key in list(sel.get_map().values()):
+            try:
+                os.kill(key.data.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        drain(time.monotonic() + 2.0)
+
+    for key in list(sel.get_map().values()):
+        sel.unregister(key.fd)
+        os.close(key.fd)
+    sel.close()
+
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully"""
     print("\n\n🛑 Shutting down Goose Dashboard...")
-    
+
+    children = [p for p in (web_process, tui_process) if p]
+    _reap_children(children)
+
+    # Children are dead by now (SIGTERM, escalated to SIGKILL at the
+    # deadline), so these reap without blocking
     if web_process:
-        web_process.terminate()
-        web_process.wait()
-    
+        web_process.join()
     if tui_process:
-        tui_process.terminate()
         tui_process.wait()
-    
+
     sys.exit(0)
 
+def _web_entry(port, ready):
+    """Forkserver child: load goose-web.py and serve it"""
+    spec = importlib.util.spec_from_file_location(
+        "goose_web", Path(__file__).parent / "goose-web.py"
+    )
+    goose_web = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(goose_web)
+
+    ready.set()
+    goose_web.socketio.run(
+        goose_web.app,
+        host='localhost',
+        port=port
+    )
+
+def _wait_port(port, timeout=5.0):
+    """Poll until something is listening on localhost:port"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        s = socket.socket()
+        result = s.connect_ex(('localhost', port))
+        s.close()
+        if result == 0:
+            return True
+        time.sleep(0.02)
+    return False
+
 def start_web_ui(port=8080):
-    """Start web UI in background"""
+    """Start web UI in a pre-warmed forkserver child"""
     global web_process
-    
+
     print(f"🌐 Starting Web UI on port {port}...")
-    
-    web_process = subprocess.Popen(
-        [sys.executable, 'goose-web.py', '--port', str(port)],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    
-    time.sleep(2)  # Wait for server to start
-    print(f"✅ Web UI running at http://localhost:{port}")
+
+    ctx = multiprocessing.get_context('forkserver')
+    ready = ctx.Event()
+    web_process = ctx.Process(target=_web_entry, args=(port, ready), daemon=True)
+    web_process.start()
+
+    # The event fires once the child is about to serve; the port probe
+    # confirms the socket is actually accepting before we report ready
+    ready.wait(timeout=10)
+    if _wait_port(port):
+        print(f"✅ Web UI running at http://localhost:{port}")
+    else:
+        print(f"⚠️ Web UI did not start listening on port {port}")
 
 def start_tui():
     """Start TUI in foreground"""
     global tui_process
-    
+
     print("🖥️ Launching Terminal UI...")
-    time.sleep(1)
-    
+
     # Run TUI directly (will take over terminal)
     try:
-        subprocess.run([sys.executable, 'goose-tui.py'])
+        tui_process = subprocess.Popen([sys.executable, 'goose-tui.py'])
+        tui_process.wait()
     except KeyboardInterrupt:
         pass
 
 def main():
     """
     Hybrid Mode Launcher
-    
+
     Starts both:
     - Web UI (background, port 8080)
     - TUI (foreground terminal)
     """
-    
+
     # Register signal handler
     signal.signal(signal.SIGINT, signal_handler)
-    
+
     print("""
 ╭────────────────────────────────────────────╮
 │                                            │
@@ -76,24 +164,19 @@ def main():
 │                                            │
 ╰────────────────────────────────────────────╯
 """)
-    
+
     # Check if required files exist
     if not Path('goose-web.py').exists():
         print("❌ Error: goose-web.py not found")
         sys.exit(1)
-    
+
     if not Path('goose-tui.py').exists():
         print("❌ Error: goose-tui.py not found")
         sys.exit(1)
-    
-    # Start web UI in background thread
-    web_thread = threading.Thread(target=start_web_ui, args=(8080,))
-    web_thread.daemon = True
-    web_thread.start()
-    
-    # Wait for web UI to initialize
-    time.sleep(3)
-    
+
+    # Start web UI (start_web_ui returns once the child signals readiness)
+    start_web_ui(8080)
+
     print("""
 ┌──────────────────────────────────────────┐
 │  INTERFACE OPTIONS:                      │
@@ -104,10 +187,10 @@ def main():
 │  Press Ctrl+C to quit both               │
 └──────────────────────────────────────────┘
 """)
-    
+
     # Start TUI in foreground (takes over terminal)
     start_tui()
-    
+
     # Cleanup when TUI exits
     signal_handler(None, None)
 
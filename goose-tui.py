@@ -4,9 +4,12 @@ Goose CLI TUI Wrapper - Terminal Chat Dashboard
 Features: Chat bubbles, session management, live streaming, MCP extensions
 """
 
-import subprocess
+import asyncio
+import functools
 import json
 import sqlite3
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from textual.app import App, ComposeResult
@@ -16,113 +19,81 @@ from textual.binding import Binding
 from textual.reactive import reactive
 from rich.text import Text
 from rich.panel import Panel
+from goose_daemon import GooseDaemon, spawn_capture
+
+# Thread-local SQLite connection cache (workers must not share connections)
+_tls = threading.local()
+
+# UTC offset sampled once at startup; datetime.strftime pays C strftime
+# plus locale lookups per call, while divmod f-string formatting is ~10x
+# cheaper - noticeable when replaying bulk history
+_UTC_OFFSET = time.localtime().tm_gmtoff
+
+# Queries compiled once at module scope so the connection's statement
+# cache hits instead of reparsing SQL text per call
+_SQL_RECENT = """
+    SELECT name, created_at, last_accessed
+    FROM sessions
+    ORDER BY last_accessed DESC
+    LIMIT ?
+"""
+
+_SQL_HISTORY = """
+    SELECT role, content, timestamp
+    FROM messages
+    WHERE session_name = ?
+    ORDER BY timestamp ASC
+"""
+
+# Fixed size of the recycled sidebar session list
+_SESSION_SLOTS = 10
+
+_SESSIONS_DB = Path.home() / ".config" / "goose" / "sessions.db"
+
+# One stat() at import; loaders re-probe lazily (and on DB errors) so
+# the sidebar recovers once goose creates the database
+_db_exists = _SESSIONS_DB.exists()
+
+def _ts() -> str:
+    """Wall-clock HH:MM:SS without the strftime overhead"""
+    s = (int(time.time()) + _UTC_OFFSET) % 86400
+    return f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}"
+
+# (CSS class, display prefix) per role - looked up instead of branching
+# per bubble, which matters when mounting thousands of history messages
+_ROLE_STYLES = {
+    "user": ("user-bubble", "You"),
+    "assistant": ("goose-bubble", "🪿 Goose"),
+    "system": ("system-bubble", "System"),
+}
+
+@functools.lru_cache(maxsize=256)
+def _format_bubble(role: str, content: str, timestamp: str) -> str:
+    """Markup for one bubble; repeated messages within the same second
+    (status pings like the thinking indicator) resolve to a cache hit"""
+    prefix = _ROLE_STYLES.get(role, _ROLE_STYLES["system"])[1]
+    return f"[dim]{timestamp}[/] [bold]{prefix}[/]\n{content}"
 
 class ChatBubble(Static):
     """A single chat message bubble"""
-    
+
     def __init__(self, role: str, content: str, timestamp: str):
         self.role = role
         self.content = content
         self.timestamp = timestamp
+        self.bubble_class = _ROLE_STYLES.get(role, _ROLE_STYLES["system"])[0]
+        self.formatted = _format_bubble(role, content, timestamp)
         super().__init__()
-    
+
     def compose(self) -> ComposeResult:
-        # Style based on role
-        if self.role == "user":
-            bubble_class = "user-bubble"
-            prefix = "You"
-        elif self.role == "assistant":
-            bubble_class = "goose-bubble"
-            prefix = "🪿 Goose"
-        else:
-            bubble_class = "system-bubble"
-            prefix = "System"
-        
-        yield Static(
-            f"[dim]{self.timestamp}[/] [bold]{prefix}[/]\n{self.content}",
-            classes=bubble_class
-        )
+        yield Static(self.formatted, classes=self.bubble_class)
 
 class GooseTUI(App):
     """Goose CLI Terminal Chat Dashboard"""
     
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-    
-    #sidebar {
-        width: 30;
-        background: $panel;
-        border-right: thick $primary;
-    }
-    
-    #chat-area {
-        width: 1fr;
-        height: 1fr;
-        padding: 1;
-    }
-    
-    #chat-messages {
-        height: 1fr;
-        border: solid $accent;
-        padding: 1;
-    }
-    
-    #input-container {
-        height: 5;
-        dock: bottom;
-        background: $panel;
-        padding: 1;
-    }
-    
-    .user-bubble {
-        background: $primary;
-        color: $text;
-        border: solid $accent;
-        padding: 1 2;
-        margin: 0 0 1 10;
-        border-radius: 2;
-    }
-    
-    .goose-bubble {
-        background: $boost;
-        color: $text;
-        border: solid $success;
-        padding: 1 2;
-        margin: 0 10 1 0;
-        border-radius: 2;
-    }
-    
-    .system-bubble {
-        background: $panel;
-        color: $warning;
-        padding: 1 2;
-        margin: 0 4 1 4;
-        border-radius: 1;
-    }
-    
-    .quick-btn {
-        width: 100%;
-        margin: 0 1;
-    }
-    
-    #session-list {
-        height: 1fr;
-        border: solid $accent;
-    }
-    
-    .session-item {
-        padding: 1;
-        background: $panel;
-        margin: 0 0 1 0;
-    }
-    
-    .session-active {
-        background: $success;
-        color: $text;
-    }
-    """
+    # Styles live in goose-tui.tcss so Textual can use its file-backed
+    # stylesheet cache instead of reparsing an inline string each run
+    CSS_PATH = Path(__file__).parent / "goose-tui.tcss"
     
     BINDINGS = [
         Binding("ctrl+n", "new_session", "New"),
@@ -136,7 +107,8 @@ class GooseTUI(App):
     
     current_session_name = reactive("")
     chat_history = []
-    sessions_db_path = Path.home() / ".config" / "goose" / "sessions.db"
+    sessions_db_path = _SESSIONS_DB
+    daemon = None
     
     def compose(self) -> ComposeResult:
         """Create chat UI layout"""
@@ -158,7 +130,18 @@ class GooseTUI(App):
                 
                 yield Static("")
                 yield Static("[bold]Recent Sessions:[/]")
-                yield ListView(id="session-list")
+                # Pre-create recycled slots; reloads update labels in
+                # place instead of allocating fresh widgets each time
+                slots = []
+                for i in range(_SESSION_SLOTS):
+                    slot = ListItem(
+                        Label(""),
+                        id=f"session-slot-{i}",
+                        classes="session-item"
+                    )
+                    slot.display = False
+                    slots.append(slot)
+                yield ListView(*slots, id="session-list")
                 
                 yield Static("")
                 yield Static("[bold]Current:[/]")
@@ -188,17 +171,11 @@ class GooseTUI(App):
         
         # Check if goose is installed
         try:
-            result = subprocess.run(
-                ["goose", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            version = result.stdout.strip()
+            version = spawn_capture(["goose", "--version"], timeout=5).strip()
             self.add_system_message(f"✅ Goose CLI {version} detected")
-            
+
             # Load recent sessions
-            self.load_recent_sessions()
+            self.run_worker(self.load_recent_sessions())
             
             # Start default session
             self.start_new_session("default")
@@ -214,7 +191,7 @@ class GooseTUI(App):
     
     def add_system_message(self, message: str):
         """Add system notification to chat"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _ts()
         bubble = ChatBubble("system", message, timestamp)
         
         chat_container = self.query_one("#chat-messages", VerticalScroll)
@@ -223,7 +200,7 @@ class GooseTUI(App):
     
     def add_user_message(self, message: str):
         """Add user message to chat"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _ts()
         bubble = ChatBubble("user", message, timestamp)
         
         chat_container = self.query_one("#chat-messages", VerticalScroll)
@@ -239,7 +216,7 @@ class GooseTUI(App):
     
     def add_goose_message(self, message: str):
         """Add Goose response to chat"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = _ts()
         bubble = ChatBubble("assistant", message, timestamp)
         
         chat_container = self.query_one("#chat-messages", VerticalScroll)
@@ -269,139 +246,138 @@ class GooseTUI(App):
         
         # Initialize goose session
         try:
-            subprocess.run(
-                ["goose", "session", "start", "-n", name],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            spawn_capture(["goose", "session", "start", "-n", name], timeout=10)
+
+            # Point the daemon at the new session
+            if self.daemon:
+                self.daemon.stop()
+            self.daemon = GooseDaemon(name)
+            self.daemon.start()
+
             self.add_system_message(f"✅ Goose session '{name}' initialized")
         except Exception as e:
             self.add_system_message(f"⚠️ Session init error: {e}")
     
     def send_to_goose(self, message: str):
-        """Send message to Goose and stream response"""
+        """Send message to Goose and stream response (runs on a worker thread)"""
         if not message.strip():
             return
-        
+
         # Add user message to chat
-        self.add_user_message(message)
-        
+        self.call_from_thread(self.add_user_message, message)
+
         # Show thinking indicator
-        self.add_system_message("🪿 Goose is thinking...")
-        
+        self.call_from_thread(self.add_system_message, "🪿 Goose is thinking...")
+
         try:
-            # Run goose with the prompt
-            if self.current_session_name:
-                cmd = [
-                    "goose", "session", "resume", "-n", 
-                    self.current_session_name, "-t", message
-                ]
-            else:
-                cmd = ["goose", "run", "-t", message]
-            
-            # Execute and capture output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
+            # Send over the persistent daemon - no per-message process spawn
+            if self.daemon is None:
+                self.daemon = GooseDaemon(self.current_session_name or "default")
+                self.daemon.start()
+
+            # Stream each chunk into the chat as it arrives
+            full_response = self.daemon.send(
+                message,
+                on_chunk=lambda chunk: self.call_from_thread(
+                    self.add_goose_message, chunk
+                )
             )
-            
-            response_lines = []
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    response_lines.append(line)
-            
-            process.wait()
-            
-            # Combine response
-            full_response = "\n".join(response_lines)
-            
-            if full_response:
-                self.add_goose_message(full_response)
-            else:
-                self.add_goose_message("✅ Task completed (no output)")
-            
+
+            if not full_response:
+                self.call_from_thread(
+                    self.add_goose_message, "✅ Task completed (no output)"
+                )
+
             # Check for errors
-            if process.returncode != 0:
-                stderr = process.stderr.read()
+            if not self.daemon.is_alive():
+                stderr = self.daemon.read_stderr()
                 if stderr:
-                    self.add_system_message(f"⚠️ Error: {stderr}")
-                    
-        except subprocess.TimeoutExpired:
-            self.add_system_message("⏱️ Request timed out")
+                    self.call_from_thread(
+                        self.add_system_message, f"⚠️ Error: {stderr}"
+                    )
+
         except Exception as e:
-            self.add_system_message(f"❌ Error: {e}")
-    
-    def load_recent_sessions(self):
+            self.call_from_thread(self.add_system_message, f"❌ Error: {e}")
+    
+    def _conn(self):
+        """Thread-local cached SQLite connection (WAL mode, read-only)"""
+        conn = getattr(_tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.sessions_db_path, check_same_thread=False,
+                isolation_level=None, cached_statements=64
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA query_only=1")
+            conn.row_factory = sqlite3.Row
+            _tls.conn = conn
+        return conn
+
+    def _fetch_recent_sessions(self):
+        """Blocking query for recent sessions (called via asyncio.to_thread)"""
+        cursor = self._conn().cursor()
+        cursor.execute(_SQL_RECENT, (_SESSION_SLOTS,))
+        return cursor.fetchall()
+
+    def _fetch_history(self, session_name: str):
+        """Blocking query for a session's messages (called via asyncio.to_thread)"""
+        cursor = self._conn().cursor()
+        cursor.execute(_SQL_HISTORY, (session_name,))
+        return cursor.fetchall()
+
+    async def load_recent_sessions(self):
         """Load recent sessions from Goose's SQLite DB"""
-        session_list = self.query_one("#session-list", ListView)
-        
+        global _db_exists
+
         # Check if sessions DB exists
-        if not self.sessions_db_path.exists():
-            self.add_system_message("📂 No sessions database found")
-            return
-        
+        if not _db_exists:
+            _db_exists = self.sessions_db_path.exists()
+            if not _db_exists:
+                self.add_system_message("📂 No sessions database found")
+                return
+
         try:
-            conn = sqlite3.connect(self.sessions_db_path)
-            cursor = conn.cursor()
-            
-            # Query recent sessions
-            cursor.execute("""
-                SELECT name, created_at, last_accessed 
-                FROM sessions 
-                ORDER BY last_accessed DESC 
-                LIMIT 10
-            """)
-            
-            sessions = cursor.fetchall()
-            
-            for name, created, accessed in sessions:
-                item = ListItem(
-                    Label(f"📂 {name}\n[dim]{accessed}[/]"),
-                    classes="session-item"
-                )
-                session_list.append(item)
-            
-            conn.close()
-            
+            # Query off the event loop so the UI keeps painting
+            sessions = await asyncio.to_thread(self._fetch_recent_sessions)
+
+            # Recycle the pre-created slots: update labels in place and
+            # toggle visibility rather than allocating widgets per reload
+            for i, (name, created, accessed) in enumerate(sessions):
+                slot = self.query_one(f"#session-slot-{i}", ListItem)
+                slot.query_one(Label).update(f"📂 {name}\n[dim]{accessed}[/]")
+                slot.display = True
+
+            for i in range(len(sessions), _SESSION_SLOTS):
+                self.query_one(f"#session-slot-{i}", ListItem).display = False
+
             if sessions:
                 self.add_system_message(f"📋 Loaded {len(sessions)} recent sessions")
             
         except sqlite3.Error as e:
+            _db_exists = self.sessions_db_path.exists()  # DB may have moved; re-probe
             self.add_system_message(f"⚠️ DB error: {e}")
         except Exception as e:
             self.add_system_message(f"⚠️ Error loading sessions: {e}")
     
-    def load_session_history(self, session_name: str):
+    async def load_session_history(self, session_name: str):
         """Load chat history from a saved session"""
         try:
-            conn = sqlite3.connect(self.sessions_db_path)
-            cursor = conn.cursor()
-            
-            # Get messages from session
-            cursor.execute("""
-                SELECT role, content, timestamp 
-                FROM messages 
-                WHERE session_name = ? 
-                ORDER BY timestamp ASC
-            """, (session_name,))
-            
-            messages = cursor.fetchall()
-            conn.close()
-            
-            # Clear current chat
+            # Query off the event loop so the UI keeps painting
+            messages = await asyncio.to_thread(self._fetch_history, session_name)
+
             chat_container = self.query_one("#chat-messages", VerticalScroll)
-            chat_container.remove_children()
-            
-            # Load messages
-            for role, content, timestamp in messages:
-                bubble = ChatBubble(role, content, timestamp)
-                chat_container.mount(bubble)
-            
+
+            # Mount every bubble in a single layout pass - per-bubble
+            # mount() recomputes layout each time, making loads O(N^2)
+            bubbles = [
+                ChatBubble(role, content, timestamp)
+                for role, content, timestamp in messages
+            ]
+
+            with self.batch_update():
+                chat_container.remove_children()
+                chat_container.mount_all(bubbles)
+
             chat_container.scroll_end(animate=False)
             
             self.current_session_name = session_name
@@ -436,8 +412,9 @@ class GooseTUI(App):
         message = chat_input.value.strip()
         
         if message:
-            self.send_to_goose(message)
             chat_input.value = ""
+            # Keep the UI responsive while goose works
+            self.run_worker(lambda: self.send_to_goose(message), thread=True)
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in input field"""
@@ -3,27 +3,122 @@
 Goose Web UI - Flask-based dashboard for remote access and configuration
 """
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
+# Patch the stdlib for greenlets before anything imports threading/subprocess
+import eventlet
+eventlet.monkey_patch()
+
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
-import subprocess
+import orjson
+import os
 import json
 import sqlite3
+import time
 from pathlib import Path
 from datetime import datetime
 import threading
 import click
 
+from goose_daemon import GooseDaemon, spawn_capture
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson - much faster than the stdlib encoder"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class _SocketIOJson:
+    """json-module shim so Socket.IO frames use orjson too"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'goose-dashboard-secret'
+app.json = OrjsonProvider(app)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(
+    app, async_mode='eventlet', cors_allowed_origins="*", json=_SocketIOJson
+)
 
 # Global state
-current_process = None
+daemons = {}
+daemons_lock = threading.Lock()
 sessions_db = Path.home() / ".config" / "goose" / "sessions.db"
 config_file = Path("config.json")
 
+# One stat() at import instead of one per API hit; handlers re-probe on
+# error in case the DB appeared (or vanished) after startup
+_db_exists = sessions_db.exists()
+_sessions_db_str = str(sessions_db)
+
+# Read-only queries, compiled once at module scope
+_Q_SESSIONS = """
+    SELECT name, created_at, last_accessed, directory
+    FROM sessions
+    ORDER BY last_accessed DESC
+"""
+
+_Q_HISTORY = """
+    SELECT role, content, timestamp
+    FROM messages
+    WHERE session_name = ?
+    ORDER BY timestamp ASC
+"""
+
+_tls = threading.local()
+
+# isoformat() per message costs microseconds in C strftime/locale work;
+# message timestamps only need second resolution, so cache per second
+_iso_cache = (0, "")
+
+def _iso_now():
+    """ISO-8601 wall-clock timestamp, cached per second"""
+    global _iso_cache
+    t = int(time.time())
+    if t != _iso_cache[0]:
+        _iso_cache = (t, datetime.fromtimestamp(t).isoformat())
+    return _iso_cache[1]
+
+def _conn():
+    """Thread-local cached SQLite connection (WAL mode, read-only)
+
+    Opening a fresh connection per request re-runs PRAGMAs and rebuilds
+    the page cache; caching one per worker thread removes that cost from
+    every dashboard poll.
+    """
+    conn = getattr(_tls, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(
+            _sessions_db_str, check_same_thread=False, isolation_level=None,
+            cached_statements=64
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA query_only=1')
+        conn.row_factory = sqlite3.Row
+        _tls.conn = conn
+    return conn
+
+def get_daemon(session_name):
+    """Get (or lazily start) the persistent Goose daemon for a session"""
+    with daemons_lock:
+        daemon = daemons.get(session_name)
+        if daemon is None:
+            daemon = GooseDaemon(session_name)
+            daemon.start()
+            daemons[session_name] = daemon
+        return daemon
+
 # Load configuration
 def load_config():
     if config_file.exists():
@@ -38,6 +133,25 @@ def load_config():
 
 config = load_config()
 
+# Serialized form last written to disk - lets duplicate POSTs skip the
+# filesystem entirely, and seeds dedupe across restarts
+_config_last = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+
+def save_config():
+    """Write config.json atomically, and only when it actually changed"""
+    global _config_last
+
+    new_bytes = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    if new_bytes == _config_last:
+        return
+
+    # Write to a sibling tempfile then rename so a crash mid-write can
+    # never leave a torn config.json behind
+    tmp = config_file.with_suffix('.tmp')
+    tmp.write_bytes(new_bytes)
+    os.replace(tmp, config_file)
+    _config_last = new_bytes
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -51,11 +165,8 @@ def api_config():
     if request.method == 'POST':
         data = request.json
         config.update(data)
-        
-        # Save to file
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-        
+        save_config()
+
         return jsonify({"status": "success", "config": config})
     
     return jsonify(config)
@@ -63,92 +174,100 @@ def api_config():
 @app.route('/api/sessions')
 def api_sessions():
     """List all sessions"""
-    if not sessions_db.exists():
-        return jsonify({"sessions": []})
+    global _db_exists
+
+    if not _db_exists:
+        _db_exists = sessions_db.exists()
+        if not _db_exists:
+            return jsonify({"sessions": []})
     
     try:
-        conn = sqlite3.connect(sessions_db)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT name, created_at, last_accessed, directory
-            FROM sessions
-            ORDER BY last_accessed DESC
-        """)
-        
-        sessions = []
-        for row in cursor.fetchall():
-            sessions.append({
-                "name": row[0],
-                "created": row[1],
-                "accessed": row[2],
-                "directory": row[3]
-            })
-        
-        conn.close()
-        return jsonify({"sessions": sessions})
-        
+        cursor = _conn().cursor()
+        cursor.execute(_Q_SESSIONS)
+
+        # Stream straight off the cursor - one dict allocation per row
+        sessions = [
+            {
+                "name": r["name"],
+                "created": r["created_at"],
+                "accessed": r["last_accessed"],
+                "directory": r["directory"]
+            }
+            for r in cursor
+        ]
+
+        # Raw orjson bytes skip jsonify's Response plumbing entirely
+        return Response(
+            orjson.dumps({"sessions": sessions}),
+            mimetype='application/json'
+        )
+
     except Exception as e:
+        _db_exists = sessions_db.exists()  # DB may have moved; re-probe
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/session/<name>/history')
 def api_session_history(name):
     """Get chat history for a session"""
-    if not sessions_db.exists():
-        return jsonify({"messages": []})
+    global _db_exists
+
+    if not _db_exists:
+        _db_exists = sessions_db.exists()
+        if not _db_exists:
+            return jsonify({"messages": []})
     
     try:
-        conn = sqlite3.connect(sessions_db)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT role, content, timestamp
-            FROM messages
-            WHERE session_name = ?
-            ORDER BY timestamp ASC
-        """, (name,))
-        
-        messages = []
-        for row in cursor.fetchall():
-            messages.append({
-                "role": row[0],
-                "content": row[1],
-                "timestamp": row[2]
-            })
-        
-        conn.close()
-        return jsonify({"messages": messages})
-        
+        cursor = _conn().cursor()
+        cursor.execute(_Q_HISTORY, (name,))
+
+        # Stream straight off the cursor - one dict allocation per row
+        messages = [
+            {
+                "role": r["role"],
+                "content": r["content"],
+                "timestamp": r["timestamp"]
+            }
+            for r in cursor
+        ]
+
+        # Raw orjson bytes skip jsonify's Response plumbing entirely
+        return Response(
+            orjson.dumps({"messages": messages}),
+            mimetype='application/json'
+        )
+
     except Exception as e:
+        _db_exists = sessions_db.exists()  # DB may have moved; re-probe
         return jsonify({"error": str(e)}), 500
 
+# The extension list is constant, so serialize it exactly once at import
+_EXT_BODY = orjson.dumps({"extensions": [
+    {
+        "name": "developer",
+        "status": "available",
+        "description": "Code analysis, debugging, file operations"
+    },
+    {
+        "name": "github",
+        "status": "available",
+        "description": "GitHub repository operations"
+    },
+    {
+        "name": "computer",
+        "status": "available",
+        "description": "System control and automation"
+    },
+    {
+        "name": "screen",
+        "status": "available",
+        "description": "Screen capture and OCR"
+    }
+]})
+
 @app.route('/api/extensions')
 def api_extensions():
     """List available extensions"""
-    extensions = [
-        {
-            "name": "developer",
-            "status": "available",
-            "description": "Code analysis, debugging, file operations"
-        },
-        {
-            "name": "github",
-            "status": "available",
-            "description": "GitHub repository operations"
-        },
-        {
-            "name": "computer",
-            "status": "available",
-            "description": "System control and automation"
-        },
-        {
-            "name": "screen",
-            "status": "available",
-            "description": "Screen capture and OCR"
-        }
-    ]
-    
-    return jsonify({"extensions": extensions})
+    return Response(_EXT_BODY, mimetype='application/json')
 
 @socketio.on('connect')
 def handle_connect():
@@ -168,47 +287,52 @@ def handle_message(data):
     emit('message', {
         'role': 'user',
         'content': message,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _iso_now()
     })
     
     # Run goose command in thread
     def run_goose():
         try:
-            cmd = ['goose', 'session', 'resume', '-n', session_name, '-t', message]
-            
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            )
-            
-            # Stream output
-            response_lines = []
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    response_lines.append(line)
-                    # Emit partial response
-                    socketio.emit('partial_response', {'content': line})
-            
-            process.wait()
-            
+            daemon = get_daemon(session_name)
+
+            # Coalesce partial_response frames: chatty goose output can
+            # produce hundreds of lines/s, and each emit pays framing and
+            # JSON encode costs. Flush on a 20ms window or 16KB boundary.
+            buf = []
+            buf_len = 0
+            last_flush = time.monotonic()
+
+            def flush_partial():
+                nonlocal buf_len, last_flush
+                if buf:
+                    socketio.emit(
+                        'partial_response', {'content': '\n'.join(buf)}
+                    )
+                    buf.clear()
+                    buf_len = 0
+                last_flush = time.monotonic()
+
+            def emit_partial(line):
+                nonlocal buf_len
+                buf.append(line)
+                buf_len += len(line)
+                if buf_len > 16384 or time.monotonic() - last_flush > 0.02:
+                    flush_partial()
+
+            full_response = daemon.send(message, on_chunk=emit_partial)
+            flush_partial()
+
             # Send complete response
-            full_response = '\n'.join(response_lines)
             socketio.emit('message', {
                 'role': 'assistant',
                 'content': full_response,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _iso_now()
             })
-            
+
         except Exception as e:
             socketio.emit('error', {'message': str(e)})
     
-    thread = threading.Thread(target=run_goose)
-    thread.daemon = True
-    thread.start()
+    socketio.start_background_task(run_goose)
 
 @socketio.on('new_session')
 def handle_new_session(data):
@@ -216,13 +340,8 @@ def handle_new_session(data):
     name = data.get('name') or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
     try:
-        subprocess.run(
-            ['goose', 'session', 'start', '-n', name],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
+        spawn_capture(['goose', 'session', 'start', '-n', name], timeout=10)
+
         emit('session_created', {'name': name, 'status': 'success'})
     except Exception as e:
         emit('error', {'message': f'Failed to create session: {e}'})
@@ -240,8 +359,7 @@ def main(port, host, debug):
         app,
         host=host,
         port=port,
-        debug=debug,
-        allow_unsafe_werkzeug=True
+        debug=debug
     )
 
 if __name__ == '__main__':
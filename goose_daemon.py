@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Goose Daemon - Persistent `goose session` child shared by the TUI and Web UI
+One long-lived process per session exchanging newline-delimited JSON frames,
+so each chat turn is a cheap RPC instead of a fresh fork+exec+imports.
+"""
+
+import io
+import json
+import os
+import selectors
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+
+def spawn_capture(argv, timeout=10.0):
+    """Run a short-lived command and capture its output via posix_spawn
+
+    os.posix_spawnp skips fork()'s address-space copy, roughly halving
+    the latency of quick probes like `goose --version`. stdout and
+    stderr share one pipe. Raises FileNotFoundError if the executable
+    is missing, and subprocess.TimeoutExpired (after SIGKILLing the
+    child) if it outlives `timeout`, matching subprocess.run.
+    """
+    r, w = os.pipe()
+    try:
+        pid = os.posix_spawnp(
+            argv[0], argv, os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, w, 1),
+                (os.POSIX_SPAWN_DUP2, w, 2),
+                (os.POSIX_SPAWN_CLOSE, r),
+                (os.POSIX_SPAWN_CLOSE, w),
+            ],
+        )
+    except OSError:
+        os.close(r)
+        os.close(w)
+        raise
+    os.close(w)
+
+    os.set_blocking(r, False)
+    sel = selectors.DefaultSelector()
+    sel.register(r, selectors.EVENT_READ)
+
+    chunks = []
+    timed_out = False
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            os.kill(pid, signal.SIGKILL)
+            timed_out = True
+            break
+        if not sel.select(timeout=remaining):
+            continue
+        data = os.read(r, 65536)
+        if not data:
+            break
+        chunks.append(data)
+
+    sel.close()
+    os.close(r)
+    os.waitpid(pid, 0)
+
+    output = b"".join(chunks).decode("utf-8", "replace")
+    if timed_out:
+        # A killed probe must stay a failure at the call sites, not
+        # masquerade as success with truncated output
+        raise subprocess.TimeoutExpired(argv, timeout, output=output)
+    return output
+
+class GooseDaemon:
+    """A long-lived `goose session` process speaking newline-delimited JSON"""
+
+    def __init__(self, session_name: str = "default"):
+        self.session_name = session_name
+        self.proc = None
+        self.pidfd = None
+        self.log_path = None
+        self.last_stderr = ""
+        # Serializes whole turns: both UIs dispatch each message on a
+        # fresh worker, so overlapping send()s would interleave reads
+        # on the same stdout fd and steal each other's frames
+        self._lock = threading.Lock()
+
+    def _release(self):
+        """Close fds and remove the log tempfile left by a previous child"""
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+
+        if self.proc is not None:
+            for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+                if pipe is not None:
+                    pipe.close()
+            self.proc = None
+
+        if self.log_path is not None:
+            try:
+                os.unlink(self.log_path)
+            except OSError:
+                pass
+            self.log_path = None
+
+    def start(self):
+        """Spawn the goose child once; stdout stays reserved for RPC frames"""
+        # Auto-restart after a crash must not leak the dead child's
+        # pidfd, pipes, or log tempfile
+        self._release()
+
+        log_file = tempfile.NamedTemporaryFile(
+            prefix="goose-daemon-", suffix=".log", delete=False
+        )
+        log_file.close()
+        self.log_path = log_file.name
+
+        self.proc = subprocess.Popen(
+            [
+                "goose", "session", "resume",
+                "-n", self.session_name,
+                "--log-file", self.log_path,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+
+        # A pidfd lets send() notice child death in its selectors loop
+        # instead of relying on a blocking wait() (Linux 5.3+)
+        try:
+            self.pidfd = os.pidfd_open(self.proc.pid)
+        except (AttributeError, OSError):
+            self.pidfd = None
+
+    def is_alive(self) -> bool:
+        """Check whether the child process is still running"""
+        return self.proc is not None and self.proc.poll() is None
+
+    def send(self, prompt: str, on_chunk=None) -> str:
+        """Send one prompt and collect response frames until the end sentinel
+
+        Writes {"t": prompt} as one JSON line, then reads newline-delimited
+        frames off stdout until {"end": true}. Each text chunk is passed to
+        on_chunk (if given) as it arrives, for streaming UIs.
+
+        Concurrent callers are serialized per daemon - there is only one
+        stdout to read, so turns must not overlap.
+        """
+        with self._lock:
+            return self._send_locked(prompt, on_chunk)
+
+    def _send_locked(self, prompt, on_chunk):
+        if not self.is_alive():
+            self.start()
+
+        self.proc.stdin.write(json.dumps({"t": prompt}) + "\n")
+        self.proc.stdin.flush()
+
+        # Drain stdout and stderr together with non-blocking reads so a
+        # chatty stderr can never fill its pipe buffer and deadlock us
+        stdout_fd = self.proc.stdout.fileno()
+        stderr_fd = self.proc.stderr.fileno()
+        os.set_blocking(stdout_fd, False)
+        os.set_blocking(stderr_fd, False)
+
+        sel = selectors.DefaultSelector()
+        sel.register(stdout_fd, selectors.EVENT_READ, "stdout")
+        sel.register(stderr_fd, selectors.EVENT_READ, "stderr")
+        if self.pidfd is not None:
+            sel.register(self.pidfd, selectors.EVENT_READ, "exit")
+
+        # Accumulate into StringIO buffers rather than list-of-lines plus
+        # a final join, which holds two full copies of a long response
+        response_buf = io.StringIO()
+        stderr_buf = io.StringIO()
+        pending = ""
+        done = False
+
+        try:
+            while not done and sel.get_map():
+                events = sel.select(timeout=0.1)
+
+                if not events and self.proc.poll() is not None:
+                    break
+
+                for key, _ in events:
+                    if key.data == "exit":
+                        # Child died; keep draining the pipes until EOF
+                        sel.unregister(key.fd)
+                        continue
+
+                    data = os.read(key.fd, 65536)
+
+                    if not data:
+                        sel.unregister(key.fd)
+                        if key.data == "stdout":
+                            done = True
+                        continue
+
+                    if key.data == "stderr":
+                        stderr_buf.write(data.decode("utf-8", "replace"))
+                        continue
+
+                    pending += data.decode("utf-8", "replace")
+                    lines = pending.split("\n")
+                    pending = lines.pop()
+
+                    for line in lines:
+                        line = line.strip()
+                        if not line:
+                            continue
+
+                        try:
+                            frame = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Tolerate plain-text lines from older goose builds
+                            frame = {"t": line}
+
+                        if frame.get("end"):
+                            done = True
+                            break
+
+                        chunk = frame.get("t", "")
+                        if chunk:
+                            if response_buf.tell():
+                                response_buf.write("\n")
+                            response_buf.write(chunk)
+                            if on_chunk:
+                                on_chunk(chunk)
+        finally:
+            sel.close()
+
+        self.last_stderr = stderr_buf.getvalue()
+        return response_buf.getvalue()
+
+    def read_stderr(self) -> str:
+        """Return stderr output captured during the last send()"""
+        return self.last_stderr
+
+    def stop(self):
+        """Terminate the child process and release its resources"""
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self._release()